@@ -2,47 +2,69 @@
 FastAPI app for the triangle-time system.
 
 Endpoints:
-- GET  /          → Triangle Console (HTML UI)
+- GET  /          → Triangle Console (HTML UI, app/static/index.html)
+- GET  /static/*  → Static assets
 - GET  /health    → Health check
 - GET  /self-test → End-to-end smoke test
 - POST /predict_time
 - POST /log_task
 
-This is what you run with gunicorn or uvicorn and (later) deploy.
+This is what you run with gunicorn or uvicorn and (later) deploy:
+
+    gunicorn -c gunicorn_conf.py app.api:app
+
+`triangle_time` must be importable: `pip install -e .` from the repo root,
+or set PYTHONPATH=src.
 """
 
 from __future__ import annotations
 
-import json
+import asyncio
+import csv
+import functools
+import gzip
+import hashlib
+import logging
 import os
-import sys
-from dataclasses import asdict
+import queue
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, fields, replace
 from pathlib import Path
-from typing import Optional
-
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
-from pydantic import BaseModel
+from typing import AsyncIterator, List, Optional, TextIO, Tuple
 
-# --- Make src/ importable ----------------------------------------------------
+import msgspec
+import orjson
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
+from fastapi.staticfiles import StaticFiles
+from pydantic import BaseModel, ConfigDict
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
-SRC_PATH = REPO_ROOT / "src"
-if str(SRC_PATH) not in sys.path:
-    sys.path.insert(0, str(SRC_PATH))
-
-from triangle_time.schema import Task, ModelParams  # noqa: E402
-from triangle_time.triangle_model import (  # noqa: E402
+from triangle_time.schema import Task, ModelParams
+from triangle_time.triangle_model import (
     predict_time_for_task,
     update_task_proportions,
 )
-from triangle_time.data_io import (  # noqa: E402
-    load_tasks_from_csv,
-    save_tasks_to_csv,
-)
+from triangle_time.data_io import load_tasks_from_csv
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows; single-process dev only
+    fcntl = None  # type: ignore[assignment]
+
+try:
+    import msgpack  # type: ignore[import]
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
 
 # --- Config-ish constants ----------------------------------------------------
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+
 DEFAULT_PARAMS_PATH = REPO_ROOT / "model_params.json"
 DEFAULT_TASK_LOG_CSV = REPO_ROOT / "data" / "tasks_logged.csv"
 
@@ -54,748 +76,404 @@ TASK_LOG_CSV_PATH = Path(
     os.getenv("TT_TASK_LOG_CSV_PATH", str(DEFAULT_TASK_LOG_CSV))
 )
 
-# FastAPI app: docs at /docs, our console UI at /
-app = FastAPI(
-    title="Triangle Time API",
-    docs_url="/docs",
-    redoc_url=None,
-)
+# Task log CSV columns, in Task field order.
+_TASK_FIELD_NAMES = tuple(f.name for f in fields(Task))
 
+# Seconds between mtime checks of the params file on the request path.
+MODEL_PARAMS_RECHECK_INTERVAL = 1.0
 
-# --- Azure-style UI at root --------------------------------------------------
+# Parsed params keyed by (path, st_mtime_ns); refreshed only when the file changes.
+_PARAMS_CACHE: Optional[Tuple[str, int, ModelParams]] = None
 
 
-@app.get("/", response_class=HTMLResponse)
-def triangle_console() -> str:
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """
-    Triangle Time Console – HTML UI sitting on top of the API.
-    """
-    return """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8" />
-  <title>Triangle Time Console</title>
-  <meta name="viewport" content="width=device-width, initial-scale=1" />
-  <style>
-    :root {
-      --azure-blue: #0078d4;
-      --azure-blue-dark: #005a9e;
-      --bg-dark: #0b1620;
-      --bg-panel: #111827;
-      --bg-card: #1f2937;
-      --text-main: #f9fafb;
-      --text-muted: #9ca3af;
-      --accent: #22c55e;
-      --danger: #f97373;
-      --border-soft: #374151;
-      --shadow-soft: 0 14px 30px rgba(0,0,0,0.45);
-      --radius-lg: 14px;
-    }
-
-    * {
-      box-sizing: border-box;
-      font-family: system-ui, -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
-    }
-
-    body {
-      margin: 0;
-      padding: 0;
-      background: radial-gradient(circle at top, #111827 0, #020617 55%);
-      color: var(--text-main);
-      min-height: 100vh;
-      display: flex;
-      align-items: stretch;
-      justify-content: center;
-    }
-
-    .shell {
-      width: 100%;
-      max-width: 1200px;
-      margin: 32px auto;
-      padding: 24px;
-      background: linear-gradient(135deg, #020617 0, #020617 40%, #020617 100%);
-      border-radius: 24px;
-      border: 1px solid #1f2937;
-      box-shadow: var(--shadow-soft);
-      display: grid;
-      grid-template-columns: minmax(0, 1.3fr) minmax(0, 1fr);
-      gap: 18px;
-    }
-
-    @media (max-width: 900px) {
-      .shell {
-        grid-template-columns: 1fr;
-        margin: 12px;
-        padding: 16px;
-      }
-    }
-
-    .header {
-      grid-column: 1 / -1;
-      display: flex;
-      align-items: center;
-      justify-content: space-between;
-      margin-bottom: 8px;
-    }
-
-    .title-block {
-      display: flex;
-      flex-direction: column;
-      gap: 4px;
-    }
-
-    .title {
-      font-size: 1.4rem;
-      font-weight: 650;
-      letter-spacing: 0.03em;
-      display: flex;
-      align-items: center;
-      gap: 10px;
-    }
-
-    .pill {
-      padding: 4px 10px;
-      border-radius: 999px;
-      background: rgba(0, 120, 212, 0.15);
-      border: 1px solid rgba(56, 189, 248, 0.5);
-      font-size: 0.72rem;
-      text-transform: uppercase;
-      letter-spacing: 0.08em;
-      color: #7dd3fc;
-    }
-
-    .subtitle {
-      font-size: 0.9rem;
-      color: var(--text-muted);
-    }
-
-    .badge-triangle {
-      display: inline-flex;
-      align-items: center;
-      justify-content: center;
-      width: 40px;
-      height: 40px;
-      border-radius: 12px;
-      background: radial-gradient(circle at 20% 0, #38bdf8, #0f172a 55%, #22c55e);
-      border: 1px solid rgba(148, 163, 184, 0.3);
-      font-weight: 700;
-      font-size: 1rem;
-    }
-
-    .left-panel, .right-panel {
-      background: var(--bg-panel);
-      border-radius: var(--radius-lg);
-      border: 1px solid var(--border-soft);
-      padding: 16px 18px;
-      display: flex;
-      flex-direction: column;
-      gap: 12px;
-    }
-
-    .section-title {
-      font-size: 0.9rem;
-      font-weight: 600;
-      letter-spacing: 0.06em;
-      text-transform: uppercase;
-      color: #9ca3af;
-    }
-
-    .card {
-      background: var(--bg-card);
-      border-radius: 12px;
-      border: 1px solid #111827;
-      padding: 12px 14px;
-    }
+    Load model params once per worker at startup, warm up the predict
+    path, and run the task log writer thread for the lifetime of the app.
 
-    .card + .card {
-      margin-top: 8px;
-    }
-
-    .chip-row {
-      display: flex;
-      flex-wrap: wrap;
-      gap: 8px;
-      margin-top: 6px;
-    }
-
-    .chip {
-      font-size: 0.75rem;
-      padding: 4px 8px;
-      border-radius: 999px;
-      border: 1px solid #1f2937;
-      background: rgba(15, 23, 42, 0.9);
-      color: var(--text-muted);
-    }
-
-    .chip strong {
-      color: #e5e7eb;
-    }
-
-    .equation {
-      font-family: "JetBrains Mono", ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", "Courier New", monospace;
-      font-size: 0.78rem;
-      background: #020617;
-      border-radius: 8px;
-      padding: 6px 8px;
-      margin: 4px 0;
-      border: 1px solid #1f2937;
-      overflow-x: auto;
-    }
-
-    .equation span.keyword {
-      color: #7dd3fc;
-    }
-
-    .equation span.sym {
-      color: #f97316;
-    }
-
-    .equation span.num {
-      color: #a5b4fc;
-    }
-
-    .equation span.fn {
-      color: #4ade80;
-    }
-
-    .mini-heading {
-      font-size: 0.78rem;
-      font-weight: 600;
-      text-transform: uppercase;
-      letter-spacing: 0.08em;
-      color: #9ca3af;
-      margin-bottom: 2px;
-      margin-top: 4px;
-    }
+    A missing params file is not fatal here: the endpoints retry the load
+    and report the error, same as before the params were cached.
+    """
+    app.state.params_checked_at = time.monotonic()
+    try:
+        set_model_params(load_model_params())
+    except FileNotFoundError:
+        app.state.params = None
+        app.state.params_dict = None
+    else:
+        _warm_up(app.state.params)
+    task_logger.start()
+    yield
+    # stop() joins the writer thread; keep that off the event loop.
+    if await asyncio.to_thread(task_logger.stop):
+        csv_appender.close()
+    else:
+        logger.warning("Task log writer did not stop in time; leaving log open")
 
-    .body-text {
-      font-size: 0.82rem;
-      color: #e5e7eb;
-      line-height: 1.4;
-    }
 
-    /* Right panel */
+# FastAPI app: docs at /docs, our console UI at /
+# JSON responses are encoded with orjson instead of stdlib json.
+app = FastAPI(
+    title="Triangle Time API",
+    docs_url="/docs",
+    redoc_url=None,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
-    .form-row {
-      display: grid;
-      grid-template-columns: repeat(3, minmax(0, 1fr));
-      gap: 10px;
-    }
 
-    .field {
-      display: flex;
-      flex-direction: column;
-      gap: 4px;
-    }
+# --- Azure-style UI at root --------------------------------------------------
 
-    .field label {
-      font-size: 0.78rem;
-      color: var(--text-muted);
-    }
 
-    .field input {
-      background: #020617;
-      border-radius: 8px;
-      border: 1px solid #1f2937;
-      padding: 6px 8px;
-      color: var(--text-main);
-      font-size: 0.85rem;
-      outline: none;
-    }
+# Static assets (the console markup lives in static/index.html).
+app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
-    .field input:focus {
-      border-color: var(--azure-blue);
-      box-shadow: 0 0 0 1px rgba(56,189,248,0.5);
-    }
+# Console bytes are read and gzipped once at import instead of per request.
+_CONSOLE_BYTES = (STATIC_DIR / "index.html").read_bytes()
+_CONSOLE_GZIP = gzip.compress(_CONSOLE_BYTES, 9)
 
-    .toggle-row {
-      display: flex;
-      align-items: center;
-      justify-content: space-between;
-      gap: 8px;
-      margin-top: 6px;
-      font-size: 0.8rem;
-      color: var(--text-muted);
-    }
+# Strong ETags must differ per content-coding, hence the "-gzip" suffix.
+_CONSOLE_DIGEST = hashlib.blake2b(_CONSOLE_BYTES, digest_size=8).hexdigest()
+_CONSOLE_ETAG = f'"{_CONSOLE_DIGEST}"'
+_CONSOLE_ETAG_GZIP = f'"{_CONSOLE_DIGEST}-gzip"'
 
-    .toggle-row span {
-      display: flex;
-      flex-direction: column;
-      gap: 2px;
-    }
+_CONSOLE_CACHE_CONTROL = "public, max-age=3600, must-revalidate"
 
-    .toggle-row code {
-      font-size: 0.72rem;
-      color: #e5e7eb;
-      background: #020617;
-      padding: 1px 4px;
-      border-radius: 4px;
-    }
 
-    .button-row {
-      display: flex;
-      gap: 10px;
-      margin-top: 10px;
-    }
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """True if an If-None-Match header value matches `etag` (weak comparison)."""
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
 
-    button {
-      border-radius: 999px;
-      border: none;
-      padding: 7px 14px;
-      font-size: 0.82rem;
-      font-weight: 500;
-      cursor: pointer;
-      display: inline-flex;
-      align-items: center;
-      gap: 6px;
-      transition: background 0.12s ease, transform 0.08s ease, box-shadow 0.12s ease;
-    }
 
-    .btn-primary {
-      background: linear-gradient(135deg, var(--azure-blue) 0, #38bdf8 100%);
-      color: white;
-      box-shadow: 0 8px 18px rgba(56, 189, 248, 0.35);
-    }
+@app.get("/", response_class=HTMLResponse, include_in_schema=False)
+def triangle_console(request: Request) -> Response:
+    """
+    Triangle Time Console – HTML UI sitting on top of the API.
 
-    .btn-primary:hover {
-      transform: translateY(-1px);
-      box-shadow: 0 12px 24px rgba(56, 189, 248, 0.45);
-      background: linear-gradient(135deg, var(--azure-blue-dark) 0, #0ea5e9 100%);
-    }
+    Serves the precompressed body when the client accepts gzip, and an
+    empty 304 when the client already has the current version.
+    """
+    use_gzip = "gzip" in request.headers.get("accept-encoding", "")
+    etag = _CONSOLE_ETAG_GZIP if use_gzip else _CONSOLE_ETAG
 
-    .btn-ghost {
-      background: transparent;
-      color: var(--text-muted);
-      border: 1px solid #1f2937;
+    headers = {
+        "Cache-Control": _CONSOLE_CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+        "ETag": etag,
     }
 
-    .btn-ghost:hover {
-      background: rgba(15,23,42,0.8);
-      color: #e5e7eb;
-    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
 
-    .status-bar {
-      font-size: 0.78rem;
-      color: var(--text-muted);
-      margin-top: 6px;
-      min-height: 18px;
-    }
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=_CONSOLE_GZIP, media_type="text/html", headers=headers)
+    return Response(content=_CONSOLE_BYTES, media_type="text/html", headers=headers)
 
-    .status-bar span.ok {
-      color: var(--accent);
-    }
 
-    .status-bar span.err {
-      color: var(--danger);
-    }
+# --- Helpers -----------------------------------------------------------------
 
-    .results-grid {
-      display: grid;
-      grid-template-columns: repeat(2, minmax(0, 1fr));
-      gap: 10px;
-      margin-top: 10px;
-    }
 
-    .metric {
-      background: #020617;
-      border-radius: 10px;
-      padding: 8px 10px;
-      border: 1px solid #1f2937;
-    }
+def load_model_params(path: Path = MODEL_PARAMS_PATH) -> ModelParams:
+    """
+    Load ModelParams from a JSON file.
 
-    .metric-label {
-      font-size: 0.75rem;
-      color: var(--text-muted);
-    }
+    Expected keys: T_gov_star, T_azure_star, T_ds_star, eta, use_entropy.
 
-    .metric-value {
-      margin-top: 2px;
-      font-size: 0.98rem;
-      font-weight: 600;
-    }
+    If msgpack is installed and `cli fit` left a `.msgpack` sidecar next to
+    the JSON that is at least as new, that is read instead; the JSON stays
+    the source of truth.
 
-    .metric-sub {
-      font-size: 0.72rem;
-      color: var(--text-muted);
-      margin-top: 2px;
-    }
+    The parsed result is cached; the file is only re-read when its
+    mtime changes (e.g. after `python -m app.cli fit ...`).
+    """
+    global _PARAMS_CACHE
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Model params file not found at {path}. "
+            "Run `python -m app.cli fit data/samples/example_tasks.csv` first."
+        ) from None
+
+    key = str(path)
+    if (
+        _PARAMS_CACHE is not None
+        and _PARAMS_CACHE[0] == key
+        and _PARAMS_CACHE[1] == mtime_ns
+    ):
+        return _PARAMS_CACHE[2]
+
+    data = None
+    if msgpack is not None:
+        sidecar = path.with_suffix(".msgpack")
+        try:
+            # An older sidecar means the JSON was edited by hand since.
+            if sidecar.stat().st_mtime_ns >= mtime_ns:
+                data = msgpack.unpackb(sidecar.read_bytes(), raw=False)
+        except FileNotFoundError:
+            pass
+    if data is None:
+        data = orjson.loads(path.read_bytes())
+
+    params = ModelParams(**data)
+    _PARAMS_CACHE = (key, mtime_ns, params)
+    return params
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_load_tasks(path: str, mtime_ns: int) -> Tuple[Task, ...]:
+    """
+    load_tasks_from_csv, memoized per (path, mtime_ns).
 
-    .footer-note {
-      font-size: 0.78rem;
-      color: var(--text-muted);
-      margin-top: 8px;
-    }
+    Returns shared Task objects; copy before mutating.
+    """
+    return tuple(load_tasks_from_csv(path))
 
-    .footer-note code {
-      background: #020617;
-      padding: 2px 6px;
-      border-radius: 6px;
-      border: 1px solid #1f2937;
-      font-size: 0.72rem;
-    }
-  </style>
-</head>
-<body>
-  <div class="shell">
-    <div class="header">
-      <div class="title-block">
-        <div class="title">
-          <div class="badge-triangle">Δt</div>
-          <span>Triangle Time Console</span>
-          <span class="pill">G / A / D · rules not vibes</span>
-        </div>
-        <div class="subtitle">
-          Triangle in, time out. No circle. No vibes. Just quant.
-        </div>
-      </div>
-    </div>
-
-    <!-- LEFT: Theory / explanation -->
-    <div class="left-panel">
-      <div class="section-title">Triangle model · mental model</div>
-
-      <div class="card">
-        <div class="mini-heading">Vertices</div>
-        <div class="body-text">
-          Every task sits inside a triangle with three vertices:
-        </div>
-        <div class="chip-row">
-          <div class="chip"><strong>G – Gov</strong> · approvals, policy, bureaucracy</div>
-          <div class="chip"><strong>A – Azure</strong> · infra, identity, integration plumbing</div>
-          <div class="chip"><strong>D – Data</strong> · ETL, ML, analytics, dashboards</div>
-        </div>
-        <div class="body-text" style="margin-top:6px;">
-          For each task we track time in hours:
-        </div>
-        <div class="equation">
-          <span class="keyword">T</span><span class="sym"> = </span>
-          <span class="keyword">T_G</span> +
-          <span class="keyword">T_A</span> +
-          <span class="keyword">T_D</span>
-        </div>
-        <div class="body-text">
-          And we convert them into triangle coordinates:
-        </div>
-        <div class="equation">
-          <span class="keyword">p_G</span> = T_G / T,
-          <span class="keyword">p_A</span> = T_A / T,
-          <span class="keyword">p_D</span> = T_D / T,
-          <span class="sym">p_G + p_A + p_D = 1</span>
-        </div>
-      </div>
-
-      <div class="card">
-        <div class="mini-heading">Predictive formula</div>
-        <div class="body-text">
-          From historical tasks we learn base times for pure vertices:
-        </div>
-        <div class="equation">
-          <span class="keyword">T_G*</span>, <span class="keyword">T_A*</span>, <span class="keyword">T_D*</span>
-          <span class="sym">→</span>
-          typical time for pure-G / pure-A / pure-D work.
-        </div>
-        <div class="body-text">
-          For a task at <code>(p_G, p_A, p_D)</code>, predicted time:
-        </div>
-        <div class="equation">
-          <span class="keyword">T_pred</span>
-          <span class="sym"> = </span>
-          p_G · T_G* + p_A · T_A* + p_D · T_D*
-        </div>
-        <div class="body-text">
-          Optional: add multi-owner drag using Shannon entropy:
-        </div>
-        <div class="equation">
-          <span class="keyword">H(p)</span>
-          <span class="sym"> = </span>
-          - Σ p_i log p_i
-        </div>
-        <div class="equation">
-          <span class="keyword">T_pred</span>
-          <span class="sym"> = </span>
-          p_G · T_G* + p_A · T_A* + p_D · T_D* + η · H(p)
-        </div>
-      </div>
-
-      <div class="card">
-        <div class="mini-heading">Flow · end-to-end</div>
-        <div class="body-text">
-          1. Track real tasks → log <code>T_G, T_A, T_D</code><br/>
-          2. Fit model params <code>(T_G*, T_A*, T_D*, η)</code><br/>
-          3. For new tasks: estimate <code>(p_G, p_A, p_D)</code><br/>
-          4. Use this console to get <strong>T_pred</strong> and log the task.
-        </div>
-      </div>
-    </div>
-
-    <!-- RIGHT: Interactive console -->
-    <div class="right-panel">
-      <div class="section-title">Triangle input · calculator</div>
-
-      <div class="card">
-        <div class="body-text" style="margin-bottom:6px;">
-          Enter either <strong>raw hours</strong> or <strong>triangle proportions</strong> and let the model predict total time.
-        </div>
-        <div class="form-row">
-          <div class="field">
-            <label for="task_id">Task ID (optional)</label>
-            <input id="task_id" type="text" placeholder="e.g. TASK-123" />
-          </div>
-          <div class="field">
-            <label for="t_gov">T_G (hours – gov)</label>
-            <input id="t_gov" type="number" step="0.01" placeholder="e.g. 2" />
-          </div>
-          <div class="field">
-            <label for="t_azure">T_A (hours – Azure)</label>
-            <input id="t_azure" type="number" step="0.01" placeholder="e.g. 3" />
-          </div>
-        </div>
-
-        <div class="form-row" style="margin-top:8px;">
-          <div class="field">
-            <label for="t_ds">T_D (hours – data)</label>
-            <input id="t_ds" type="number" step="0.01" placeholder="e.g. 1" />
-          </div>
-          <div class="field">
-            <label for="p_gov">p_G (0–1)</label>
-            <input id="p_gov" type="number" step="0.01" placeholder="optional" />
-          </div>
-          <div class="field">
-            <label for="p_azure">p_A (0–1)</label>
-            <input id="p_azure" type="number" step="0.01" placeholder="optional" />
-          </div>
-        </div>
-
-        <div class="form-row" style="margin-top:8px;">
-          <div class="field">
-            <label for="p_ds">p_D (0–1)</label>
-            <input id="p_ds" type="number" step="0.01" placeholder="optional" />
-          </div>
-          <div class="field">
-            <label for="t_total">T_total (optional)</label>
-            <input id="t_total" type="number" step="0.01" placeholder="auto if empty" />
-          </div>
-          <div></div>
-        </div>
-
-        <div class="button-row">
-          <button class="btn-primary" onclick="handlePredict()">
-            ▶ Predict time
-          </button>
-          <button class="btn-ghost" onclick="handleLogTask()">
-            ⬩ Log task only
-          </button>
-        </div>
-
-        <div class="status-bar" id="status_bar"></div>
-      </div>
-
-      <div class="card">
-        <div class="mini-heading">Result snapshot</div>
-        <div class="results-grid">
-          <div class="metric">
-            <div class="metric-label">Predicted total time</div>
-            <div class="metric-value" id="metric_tpred">–</div>
-            <div class="metric-sub">hours</div>
-          </div>
-          <div class="metric">
-            <div class="metric-label">Triangle mix (p_G / p_A / p_D)</div>
-            <div class="metric-value" id="metric_mix">–</div>
-            <div class="metric-sub">normalized from inputs</div>
-          </div>
-        </div>
-
-        <div class="mini-heading" style="margin-top:8px;">Model parameters</div>
-        <div class="results-grid">
-          <div class="metric">
-            <div class="metric-label">Base times (G / A / D)</div>
-            <div class="metric-value" id="metric_bases">–</div>
-            <div class="metric-sub">T_G*, T_A*, T_D*</div>
-          </div>
-          <div class="metric">
-            <div class="metric-label">Entropy weight η</div>
-            <div class="metric-value" id="metric_eta">–</div>
-            <div class="metric-sub">if using multi-owner drag</div>
-          </div>
-        </div>
-
-        <div class="footer-note">
-          Backed by your <code>model_params.json</code> and task log in <code>data/tasks_logged.csv</code>.
-        </div>
-      </div>
-    </div>
-  </div>
-
-  <script>
-    function readNumber(id) {
-      const el = document.getElementById(id);
-      if (!el) return null;
-      const v = el.value.trim();
-      if (v === "") return null;
-      const num = Number(v);
-      return isNaN(num) ? null : num;
-    }
 
-    function setStatus(msg, type = "info") {
-      const bar = document.getElementById("status_bar");
-      if (!bar) return;
-      if (!msg) {
-        bar.textContent = "";
-        return;
-      }
-      const span = document.createElement("span");
-      span.textContent = msg;
-      span.className = type === "err" ? "err" : "ok";
-      bar.innerHTML = "";
-      bar.appendChild(span);
-    }
+def set_model_params(params: ModelParams) -> None:
+    """
+    Publish params on app.state together with their dict form.
 
-    function updateMetricsFromPredict(resp, payload) {
-      const tpredEl = document.getElementById("metric_tpred");
-      const mixEl = document.getElementById("metric_mix");
-      const basesEl = document.getElementById("metric_bases");
-      const etaEl = document.getElementById("metric_eta");
-
-      if (tpredEl) tpredEl.textContent = resp.T_pred?.toFixed(2) ?? "–";
-
-      const p_g = payload.p_gov ?? null;
-      const p_a = payload.p_azure ?? null;
-      const p_d = payload.p_ds ?? null;
-
-      let mixText = "–";
-      if (p_g != null || p_a != null || p_d != null) {
-        const pg = p_g != null ? p_g : 0;
-        const pa = p_a != null ? p_a : 0;
-        const pd = p_d != null ? p_d : 0;
-        mixText = `${pg.toFixed(2)} / ${pa.toFixed(2)} / ${pd.toFixed(2)}`;
-      }
-      if (mixEl) mixEl.textContent = mixText;
-
-      const params = resp.model_params || {};
-      const tg = params.T_gov_star ?? params.T_G_star ?? null;
-      const ta = params.T_azure_star ?? params.T_A_star ?? null;
-      const td = params.T_ds_star ?? params.T_D_star ?? null;
-      if (basesEl) {
-        if (tg != null && ta != null && td != null) {
-          basesEl.textContent = `${tg.toFixed(2)} / ${ta.toFixed(2)} / ${td.toFixed(2)}`;
-        } else {
-          basesEl.textContent = "–";
-        }
-      }
-      if (etaEl) {
-        const eta = params.eta ?? params.eta_entropy ?? null;
-        etaEl.textContent = eta != null ? eta.toFixed(4) : "–";
-      }
-    }
+    app.state.params_dict is built once here and the same dict object is
+    returned in every /predict_time response, so it must be treated as
+    read-only. It is only replaced, never mutated, when params change.
+    """
+    if getattr(app.state, "params", None) is params:
+        return
+    app.state.params = params
+    app.state.params_dict = asdict(params)
 
-    async function handlePredict() {
-      setStatus("Calling /predict_time ...", "info");
-      const taskId = document.getElementById("task_id").value.trim() || null;
-
-      const payload = {
-        task_id: taskId,
-        T_gov: readNumber("t_gov") ?? 0,
-        T_azure: readNumber("t_azure") ?? 0,
-        T_ds: readNumber("t_ds") ?? 0,
-        T_total: readNumber("t_total"),
-        p_gov: readNumber("p_gov"),
-        p_azure: readNumber("p_azure"),
-        p_ds: readNumber("p_ds")
-      };
-
-      try {
-        const res = await fetch("/predict_time", {
-          method: "POST",
-          headers: { "Content-Type": "application/json" },
-          body: JSON.stringify(payload)
-        });
-        if (!res.ok) {
-          const txt = await res.text();
-          setStatus("Error from /predict_time: " + txt, "err");
-          return;
-        }
-        const data = await res.json();
-        updateMetricsFromPredict(data, payload);
-        setStatus("Prediction OK for " + (data.task_id || "task") + ".", "ok");
-      } catch (err) {
-        console.error(err);
-        setStatus("Failed to call /predict_time – check server logs.", "err");
-      }
-    }
 
-    async function handleLogTask() {
-      setStatus("Logging task via /log_task ...", "info");
-      const taskId = document.getElementById("task_id").value.trim() || null;
-
-      const payload = {
-        task_id: taskId,
-        T_gov: readNumber("t_gov") ?? 0,
-        T_azure: readNumber("t_azure") ?? 0,
-        T_ds: readNumber("t_ds") ?? 0,
-        T_total: readNumber("t_total"),
-        p_gov: readNumber("p_gov"),
-        p_azure: readNumber("p_azure"),
-        p_ds: readNumber("p_ds")
-      };
-
-      try {
-        const res = await fetch("/log_task", {
-          method: "POST",
-          headers: { "Content-Type": "application/json" },
-          body: JSON.stringify(payload)
-        });
-        if (!res.ok) {
-          const txt = await res.text();
-          setStatus("Error from /log_task: " + txt, "err");
-          return;
-        }
-        await res.json();
-        setStatus("Task logged to backend (CSV / future DB).", "ok");
-      } catch (err) {
-        console.error(err);
-        setStatus("Failed to call /log_task – check server logs.", "err");
-      }
-    }
-  </script>
-</body>
-</html>
+async def get_model_params() -> ModelParams:
     """
+    Return the current params, re-checking the file's mtime at most every
+    MODEL_PARAMS_RECHECK_INTERVAL seconds so a re-fit is picked up by every
+    worker without a restart.
 
+    Raises HTTPException(500) if the params file is missing.
+    """
+    params = getattr(app.state, "params", None)
+    now = time.monotonic()
+    checked_at = getattr(app.state, "params_checked_at", 0.0)
+    if params is not None and now - checked_at < MODEL_PARAMS_RECHECK_INTERVAL:
+        return params
 
-# --- Helpers -----------------------------------------------------------------
+    try:
+        params = await asyncio.to_thread(load_model_params)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    app.state.params_checked_at = now
+    set_model_params(params)
+    return params
 
 
-def load_model_params(path: Path = MODEL_PARAMS_PATH) -> ModelParams:
+class _CsvAppender:
     """
-    Load ModelParams from a JSON file.
-
-    Expected keys: T_gov_star, T_azure_star, T_ds_star, eta, use_entropy.
+    Keeps the task log CSV open in append mode.
+
+    Each write() call buffers its whole batch (64 KB buffer) and flushes it
+    to the OS once at the end, so a batch costs one write syscall. The parent
+    directory is created up front and the file is opened lazily on first
+    write. Whether a header is needed is decided by one size check on the
+    first open only. Meant to be driven by the AsyncTaskLogger writer
+    thread. Replace with DB/Azure in prod.
     """
-    if not path.exists():
-        raise FileNotFoundError(
-            f"Model params file not found at {path}. "
-            "Run `python -m app.cli fit data/samples/example_tasks.csv` first."
-        )
-    data = json.loads(path.read_text(encoding="utf-8"))
-    return ModelParams(**data)
-
 
-def append_task_to_csv(task: Task, path: Path = TASK_LOG_CSV_PATH) -> None:
+    def __init__(self, path: Path, *, buffering: int = 1 << 16) -> None:
+        self.path = path
+        self.buffering = buffering
+        self._path_str = str(path)
+        self._file: Optional[TextIO] = None
+        self._writer = None
+        self._header_written = False
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _open(self) -> None:
+        # backslashreplace: a str that isn't valid UTF-8 (e.g. a lone
+        # surrogate) is escaped instead of failing the whole batch.
+        self._file = open(
+            self._path_str,
+            "a",
+            newline="",
+            encoding="utf-8",
+            errors="backslashreplace",
+            buffering=self.buffering,
+        )
+        self._writer = csv.writer(self._file)
+
+        if not self._header_written:
+            self._write_header_if_empty()
+            self._header_written = True
+
+    def _write_header_if_empty(self) -> None:
+        """
+        Write the header to a new/empty log, straight to disk.
+
+        Several gunicorn workers may open a fresh log at once; the size check
+        and header write happen under an exclusive file lock, and the header
+        is flushed before the lock is released, so only one of them writes it.
+        """
+        fd = self._file.fileno()
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            # Opening in "a" mode created the file if needed.
+            if os.fstat(fd).st_size == 0:
+                self._writer.writerow(_TASK_FIELD_NAMES)
+                self._file.flush()
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def write(self, tasks: List[Task]) -> None:
+        """Write one row per task, filling in T_total / p_* if missing."""
+        with self._lock:
+            if self._file is None:
+                self._open()
+            for task in tasks:
+                task = update_task_proportions(task)
+                # Plain attribute reads; asdict() would deep-copy every field.
+                self._writer.writerow(
+                    tuple(getattr(task, name) for name in _TASK_FIELD_NAMES)
+                )
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                self._writer = None
+
+
+# Created at import, so the log directory exists before the first request.
+csv_appender = _CsvAppender(TASK_LOG_CSV_PATH)
+
+
+# Sentinel pushed onto the queue to stop the writer thread.
+_STOP = object()
+
+
+class AsyncTaskLogger:
     """
-    Append a single task to the task log CSV.
+    Queue-backed task logger that keeps CSV writes off the request path.
 
-    This is intentionally simple: load existing, append, overwrite.
-    Good enough for low-volume / demo. Replace with DB/Azure in prod.
+    log() only enqueues the task. A daemon thread drains the queue and
+    appends to the CSV in batches: whenever `batch_size` tasks are buffered
+    or `flush_interval` seconds have passed since the first buffered task.
+    If the queue is full the task is dropped rather than blocking.
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
 
-    existing_tasks = []
-    if path.exists():
-        existing_tasks = load_tasks_from_csv(str(path))
-
-    existing_tasks.append(update_task_proportions(task))
-    save_tasks_to_csv(existing_tasks, str(path))
+    def __init__(
+        self,
+        appender: _CsvAppender,
+        *,
+        maxsize: int = 10_000,
+        batch_size: int = 100,
+        flush_interval: float = 0.2,
+    ) -> None:
+        self.appender = appender
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=self._writer_loop,
+            name="task-log-writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> bool:
+        """
+        Flush everything queued so far and stop the writer thread.
+
+        Blocks for up to `timeout` seconds. Returns False if the thread is
+        still running afterwards, e.g. because it is stuck on a slow disk.
+        """
+        if self._thread is None:
+            return True
+        deadline = time.monotonic() + timeout
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return False
+        self._thread.join(max(0.0, deadline - time.monotonic()))
+        if self._thread.is_alive():
+            return False
+        self._thread = None
+        return True
+
+    def log(self, task: Task) -> bool:
+        """
+        Queue a task for writing. Returns False if it had to be dropped,
+        i.e. the queue is full or the writer thread is not running.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            logger.warning(
+                "Task log writer is not running; dropping task %s", task.task_id
+            )
+            return False
+        try:
+            self._queue.put_nowait(task)
+        except queue.Full:
+            logger.warning("Task log queue is full; dropping task %s", task.task_id)
+            return False
+        return True
+
+    def _writer_loop(self) -> None:
+        buffer: List[Task] = []
+        deadline = 0.0
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if buffer else 1.0
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                self._write(buffer)
+                return
+            if item is not None:
+                if not buffer:
+                    deadline = time.monotonic() + self.flush_interval
+                buffer.append(item)
+
+            if buffer and (
+                len(buffer) >= self.batch_size or time.monotonic() >= deadline
+            ):
+                self._write(buffer)
+                buffer = []
+
+    def _write(self, tasks: List[Task]) -> None:
+        if not tasks:
+            return
+        try:
+            self.appender.write(tasks)
+        except Exception:
+            # Keep the writer alive; losing a batch beats losing the thread.
+            logger.exception(
+                "Failed to write %d task(s) to %s", len(tasks), self.appender.path
+            )
+
+
+task_logger = AsyncTaskLogger(csv_appender)
 
 
 # --- Request / Response schemas ----------------------------------------------
@@ -810,8 +488,11 @@ class TaskPayload(BaseModel):
     - Optionally p_gov, p_azure, p_ds if you already have proportions.
 
     If proportions are missing, they will be computed from times.
+    Unknown fields are rejected.
     """
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     task_id: Optional[str] = None
 
     T_gov: float = 0.0
@@ -824,17 +505,84 @@ class TaskPayload(BaseModel):
     p_ds: Optional[float] = None
 
 
+class ModelParamsOut(BaseModel):
+    """Wire form of triangle_time.schema.ModelParams."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    T_gov_star: float
+    T_azure_star: float
+    T_ds_star: float
+    eta: float = 0.0
+    use_entropy: bool = False
+
+
 class PredictResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     task_id: Optional[str]
     T_pred: float
-    model_params: dict
+    model_params: ModelParamsOut
 
 
 class LogTaskResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     status: str
     task: dict
 
 
+# msgspec mirrors of the response models for the hot POST endpoints:
+# encoded straight to bytes, with no validation or intermediate dict walk.
+
+
+class PredictOut(msgspec.Struct):
+    task_id: Optional[str]
+    T_pred: float
+    model_params: dict
+
+
+class LogTaskOut(msgspec.Struct):
+    status: str
+    task: dict
+
+
+_json_encoder = msgspec.json.Encoder()
+
+
+def _json_response(obj: msgspec.Struct) -> Response:
+    return Response(content=_json_encoder.encode(obj), media_type="application/json")
+
+
+def _warm_up(params: ModelParams) -> None:
+    """
+    Run one synthetic request through the /predict_time code path.
+
+    Moves first-call costs (validator setup, prediction math, response
+    encoding) to startup instead of the first real request.
+    """
+    payload = TaskPayload.model_validate({"T_gov": 1.0, "T_azure": 1.0, "T_ds": 1.0})
+    task = task_from_payload(payload)
+    T_pred = predict_time_for_task(task, params)
+    _json_encoder.encode(
+        PredictOut(task_id="_warm", T_pred=T_pred, model_params=asdict(params))
+    )
+
+
+def task_from_payload(payload: TaskPayload) -> Task:
+    """Build a Task from a request payload (positional, in Task field order)."""
+    return Task(
+        payload.task_id,
+        payload.T_gov,
+        payload.T_azure,
+        payload.T_ds,
+        payload.T_total,
+        payload.p_gov,
+        payload.p_azure,
+        payload.p_ds,
+    )
+
+
 # --- Health + self-test ------------------------------------------------------
 
 
@@ -845,44 +593,49 @@ def health() -> dict:
 
 
 @app.get("/self-test")
-def self_test() -> dict:
+async def self_test() -> dict:
     """
     End-to-end smoke test:
 
     1. Load example tasks from data/samples/example_tasks.csv
     2. Load model params from model_params.json
     3. Predict time for the first task
-    4. Append that task into the task log CSV
+    4. Queue that task for the task log CSV
     """
     sample_csv = REPO_ROOT / "data" / "samples" / "example_tasks.csv"
-    if not sample_csv.exists():
+    try:
+        mtime_ns = sample_csv.stat().st_mtime_ns
+    except FileNotFoundError:
         raise HTTPException(
             status_code=500,
             detail=f"Sample CSV not found at {sample_csv}",
-        )
+        ) from None
 
-    tasks = load_tasks_from_csv(str(sample_csv))
+    tasks = await asyncio.to_thread(_cached_load_tasks, str(sample_csv), mtime_ns)
     if not tasks:
         raise HTTPException(
             status_code=500,
             detail="No tasks found in example_tasks.csv",
         )
 
-    task = tasks[0]
+    # Copy: the cached Task is shared and prediction fills in T_total / p_*.
+    task = replace(tasks[0])
 
+    # Go through the mtime check so the smoke test also picks up re-fits.
     try:
-        params = load_model_params()
+        params = await asyncio.to_thread(load_model_params)
     except FileNotFoundError as e:
         raise HTTPException(status_code=500, detail=str(e))
+    set_model_params(params)
 
     T_pred = predict_time_for_task(task, params)
-    append_task_to_csv(task)
+    task_logger.log(task)
 
     return {
         "ok": True,
         "sample_task": asdict(task),
         "T_pred": T_pred,
-        "model_params": asdict(params),
+        "model_params": app.state.params_dict,
         "task_log_csv": str(TASK_LOG_CSV_PATH),
     }
 
@@ -890,67 +643,74 @@ def self_test() -> dict:
 # --- Main endpoints ----------------------------------------------------------
 
 
-@app.post("/predict_time", response_model=PredictResponse)
-def predict_time(payload: TaskPayload) -> PredictResponse:
+# The POST handlers encode their msgspec structs directly and skip FastAPI's
+# response validation + jsonable_encoder pass. The pydantic response models
+# are only attached via `responses=` so /docs still shows the schema.
+
+
+@app.post(
+    "/predict_time",
+    response_model=None,
+    responses={200: {"model": PredictResponse}},
+)
+async def predict_time(payload: TaskPayload) -> Response:
     """
     Predict the total time for a task.
 
     You can send either raw times T_G/T_A/T_D (and optional T_total),
     or pre-computed proportions p_G/p_A/p_D.
     """
-    try:
-        params = load_model_params()
-    except FileNotFoundError as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    params = await get_model_params()
 
-    task = Task(
-        task_id=payload.task_id,
-        T_gov=payload.T_gov,
-        T_azure=payload.T_azure,
-        T_ds=payload.T_ds,
-        T_total=payload.T_total,
-        p_gov=payload.p_gov,
-        p_azure=payload.p_azure,
-        p_ds=payload.p_ds,
-    )
+    task = task_from_payload(payload)
 
     T_pred = predict_time_for_task(task, params)
 
-    return PredictResponse(
-        task_id=task.task_id,
-        T_pred=T_pred,
-        model_params=asdict(params),
+    return _json_response(
+        PredictOut(
+            task_id=task.task_id,
+            T_pred=T_pred,
+            model_params=app.state.params_dict,
+        )
     )
 
 
-@app.post("/log_task", response_model=LogTaskResponse)
-def log_task(payload: TaskPayload) -> LogTaskResponse:
+@app.post(
+    "/log_task",
+    response_model=None,
+    responses={200: {"model": LogTaskResponse}},
+)
+async def log_task(payload: TaskPayload) -> Response:
     """
     Log a completed task with actual time into the CSV log.
+
+    The row is queued for the background writer; status is "dropped" if
+    the queue was full or the writer is not running.
     """
-    task = Task(
-        task_id=payload.task_id,
-        T_gov=payload.T_gov,
-        T_azure=payload.T_azure,
-        T_ds=payload.T_ds,
-        T_total=payload.T_total,
-        p_gov=payload.p_gov,
-        p_azure=payload.p_azure,
-        p_ds=payload.p_ds,
-    )
+    task = task_from_payload(payload)
 
     task = update_task_proportions(task)
-    append_task_to_csv(task)
+    task_dict = asdict(task)
 
-    return LogTaskResponse(
-        status="ok",
-        task=asdict(task),
-    )
+    # Encode before queueing so a request that fails here never logs a row.
+    body = _json_encoder.encode(LogTaskOut(status="ok", task=task_dict))
+    if not task_logger.log(task):
+        body = _json_encoder.encode(LogTaskOut(status="dropped", task=task_dict))
 
+    return Response(content=body, media_type="application/json")
 
-# Convenience for local dev:
-# uvicorn app.api:app --reload
+
+# Convenience for local dev (single process; add --reload via the uvicorn CLI):
+#   python -m app.api
+# uvicorn's default loop/http "auto" picks uvloop + httptools when installed.
+# Production: gunicorn -c gunicorn_conf.py app.api:app
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("app.api:app", host="0.0.0.0", port=8000, reload=True)
+    uvicorn.run(
+        "app.api:app",
+        host="0.0.0.0",
+        port=8000,
+        access_log=False,
+        log_level="warning",
+    )
@@ -11,37 +11,59 @@ Usage examples:
 
     # Export the model parameters to another path
     python -m app.cli export-params params.json
+
+Requires `triangle_time` to be importable (`pip install -e .` or PYTHONPATH=src).
 """
 
 from __future__ import annotations
 
 import argparse
 import json
-import sys
 from dataclasses import asdict
 from pathlib import Path
 
-# --- Make src/ importable ----------------------------------------------------
-
-REPO_ROOT = Path(__file__).resolve().parents[1]
-SRC_PATH = REPO_ROOT / "src"
-if str(SRC_PATH) not in sys.path:
-    sys.path.insert(0, str(SRC_PATH))
-
 from triangle_time.data_io import load_tasks_from_csv
 from triangle_time.schema import Task, ModelParams
 from triangle_time.training import fit_model
 from triangle_time.triangle_model import predict_time_for_task
 
+try:
+    import msgpack  # type: ignore[import]
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback for dev setups
+    orjson = None  # type: ignore[assignment]
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_PARAMS_PATH = REPO_ROOT / "model_params.json"
 
 
+# --- JSON helpers ------------------------------------------------------------
+
+
+def _read_json(path: Path) -> dict:
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _dumps_pretty(data: dict) -> str:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+
 # --- Commands ----------------------------------------------------------------
 
 
 def cmd_fit(args: argparse.Namespace) -> None:
     """
     Fit model from a CSV of historical tasks and save params as JSON.
+
+    If msgpack is installed, also writes a binary `.msgpack` sidecar next
+    to the JSON, which the API prefers for faster startup.
     """
     csv_path = Path(args.csv_path).resolve()
     params_path = Path(args.params_path).resolve()
@@ -58,9 +80,15 @@ def cmd_fit(args: argparse.Namespace) -> None:
 
     params_path.parent.mkdir(parents=True, exist_ok=True)
     params_json = asdict(params)
-    params_path.write_text(json.dumps(params_json, indent=2), encoding="utf-8")
+    params_path.write_text(_dumps_pretty(params_json), encoding="utf-8")
 
     print(f"[fit] Saved model params to {params_path}")
+
+    # Written after the JSON so its mtime is never older than the JSON's.
+    if msgpack is not None:
+        sidecar_path = params_path.with_suffix(".msgpack")
+        sidecar_path.write_bytes(msgpack.packb(params_json))
+        print(f"[fit] Saved binary params sidecar to {sidecar_path}")
     print("[fit] Done.")
 
 
@@ -79,16 +107,16 @@ def cmd_predict(args: argparse.Namespace) -> None:
             "Run `python -m app.cli fit ...` first."
         )
 
-    task_data = json.loads(task_json_path.read_text(encoding="utf-8"))
+    task_data = _read_json(task_json_path)
     task = Task(**task_data)
 
-    params_data = json.loads(params_path.read_text(encoding="utf-8"))
+    params_data = _read_json(params_path)
     params = ModelParams(**params_data)
 
     T_pred = predict_time_for_task(task, params)
 
     print("[predict] Input task:")
-    print(json.dumps(task_data, indent=2))
+    print(_dumps_pretty(task_data))
     print()
     print(f"[predict] Predicted total time: {T_pred:.4f}")
 
@@ -0,0 +1,29 @@
+"""
+Gunicorn settings for serving the triangle-time API in production.
+
+Usage (from repo root):
+
+    gunicorn -c gunicorn_conf.py app.api:app
+
+Runs one UvicornWorker (uvloop + httptools via uvicorn[standard]) per
+process, with the classic 2 * CPU + 1 worker count.
+
+Environment variables (all optional):
+- WEB_CONCURRENCY  number of worker processes
+- TT_BIND          bind address (default 0.0.0.0:8000)
+- TT_ACCESSLOG     set to 1 to log every request to stdout
+- TT_LOG_LEVEL     gunicorn log level (default warning)
+"""
+
+from __future__ import annotations
+
+import os
+
+workers = int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+bind = os.getenv("TT_BIND", "0.0.0.0:8000")
+
+# Access logging formats a record per request; keep it opt-in.
+accesslog = "-" if os.getenv("TT_ACCESSLOG") == "1" else None
+errorlog = "-"
+loglevel = os.getenv("TT_LOG_LEVEL", "warning")
@@ -12,13 +12,16 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """
     Represents a single task / ticket / project instance.
 
     Times are in arbitrary but consistent units (e.g., hours).
     Proportions are barycentric coordinates inside the triangle.
+
+    Slotted (no per-instance __dict__) since one is built per API request.
+    Field order is part of the interface: positional construction relies on it.
     """
 
     task_id: Optional[str] = None